@@ -0,0 +1,179 @@
+"""
+Gibbs sweep kernels.
+
+``gibbs_sweep`` is the OpenMP extension built from ``gibbs_core.pyx`` when
+it is available, otherwise the numba kernel below. When neither is
+installed it is None and callers fall back to ``numpy_gibbs_sweep``.
+``gibbs_pass`` picks the kernel; early exit is only supported by the NumPy
+sweep.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+
+# Cumulative acceptance rate above which a pass may stop early
+SATURATED_ACCEPT_RATE = 0.48
+
+
+def numpy_gibbs_sweep(X, u, rng, proposals_pool, new_sums, accept, min_coords=None):
+    """
+    In-place Gibbs sweep over the coordinates in order, in NumPy.
+
+    The first ``min_coords`` coordinates are always swept. Each later
+    coordinate is swept only while the cumulative acceptance rate is at
+    most ``SATURATED_ACCEPT_RATE``.
+
+    Parameters
+    ----------
+    X : ndarray
+        Coordinate-major float32 particle array (n x N) with contiguous
+        rows, updated in place
+    u : float
+        Current level threshold on the particle sum
+    rng : numpy.random.Generator
+        Source of the N(0,1) proposals
+    proposals_pool : ndarray
+        Float32 (n x N) buffer of proposals. The first ``min_coords`` rows
+        are drawn in one call, and the rest in a second call only if the
+        sweep continues past them.
+    new_sums, accept : ndarray
+        Length-N float64 and bool scratch buffers
+    min_coords : int, optional
+        Number of coordinates always swept (default: all)
+
+    Returns
+    -------
+    total_accepts : int
+        Number of accepted coordinate moves
+    n_swept : int
+        Number of coordinates swept
+    """
+    n, N = X.shape
+    if min_coords is None:
+        min_coords = n
+    total_accepts = 0
+    n_swept = 0
+    current_sums = X.sum(axis=0, dtype=np.float64)
+    rng.standard_normal(dtype=np.float32, out=proposals_pool[:min_coords])
+    for j in range(n):
+        if j >= min_coords and total_accepts > SATURATED_ACCEPT_RATE * N * j:
+            break
+        if j == min_coords:
+            # Not saturated: draw the remaining rows in one go
+            rng.standard_normal(dtype=np.float32, out=proposals_pool[j:])
+        proposals = proposals_pool[j]
+        np.subtract(current_sums, X[j], out=new_sums)
+        np.add(new_sums, proposals, out=new_sums)
+        np.greater_equal(new_sums, u, out=accept)
+        np.copyto(X[j], proposals, where=accept)
+        np.copyto(current_sums, new_sums, where=accept)
+        total_accepts += np.count_nonzero(accept)
+        n_swept = j + 1
+    return total_accepts, n_swept
+
+
+if HAVE_NUMBA:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def numba_gibbs_sweep(X, u, seed):
+        """
+        One in-place Gibbs sweep over all coordinates of every particle.
+
+        Each coordinate is replaced by a fresh N(0,1) proposal whenever the
+        resulting particle sum stays at or above ``u``.
+
+        Parameters
+        ----------
+        X : ndarray
+            Coordinate-major particle array (n x N), float32 or float64,
+            updated in place. Particle sums are accumulated in float64.
+        u : float
+            Current level threshold on the particle sum
+        seed : int
+            Seed for numba's generator. Under ``parallel=True`` each thread
+            draws its own stream, so runs are not bit-reproducible across
+            thread counts.
+
+        Returns
+        -------
+        total_accepts : int
+            Number of accepted coordinate moves
+        """
+        np.random.seed(seed)
+        n, N = X.shape
+        total_accepts = 0
+        for i in prange(N):
+            s = 0.0
+            for j in range(n):
+                s += X[j, i]
+            for j in range(n):
+                p = np.random.standard_normal()
+                ns = s - X[j, i] + p
+                if ns >= u:
+                    X[j, i] = p
+                    s = ns
+                    total_accepts += 1
+        return total_accepts
+
+else:
+    numba_gibbs_sweep = None
+
+
+try:
+    from .gibbs_core import gibbs_sweep
+except ImportError:
+    try:
+        from gibbs_core import gibbs_sweep
+    except ImportError:
+        gibbs_sweep = numba_gibbs_sweep
+
+
+def gibbs_pass(X, u, rng, scratch=None, min_sweep_fraction=1.0, compiled=True):
+    """
+    One Gibbs pass over the particles, optionally cut short.
+
+    With the NumPy sweep, the first ``ceil(min_sweep_fraction * n)``
+    coordinates are always swept. Each remaining coordinate is swept only
+    while the cumulative acceptance rate is at most
+    ``SATURATED_ACCEPT_RATE``. Values below 1 shorten the pass at the cost
+    of less decorrelation between levels, since particles no longer get a
+    full Gibbs sweep. The compiled kernels always run a full sweep and
+    ignore ``min_sweep_fraction``.
+
+    Parameters
+    ----------
+    X : ndarray
+        Coordinate-major float32 particle array (n x N), updated in place
+    u : float
+        Current level threshold on the particle sum
+    rng : numpy.random.Generator
+        Source of proposals, or of seeds for the compiled kernels
+    scratch : tuple of ndarray, optional
+        ``(proposals_pool, new_sums, accept)`` buffers for
+        ``numpy_gibbs_sweep``; only needed when no compiled kernel is used
+    min_sweep_fraction : float
+        Fraction of coordinates always swept by the NumPy sweep
+        (default: 1.0, full sweep)
+    compiled : bool
+        Use ``gibbs_sweep`` when it is available (default: True)
+
+    Returns
+    -------
+    total_accepts : int
+        Number of accepted coordinate moves
+    n_swept : int
+        Number of coordinates swept
+    """
+    n = X.shape[0]
+    if compiled and gibbs_sweep is not None:
+        return gibbs_sweep(X, u, rng.integers(2**31)), n
+    min_coords = min(n, max(1, math.ceil(min_sweep_fraction * n)))
+    return numpy_gibbs_sweep(X, u, rng, *scratch, min_coords)
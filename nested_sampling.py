@@ -4,8 +4,15 @@ Core nested sampling algorithm implementation.
 
 import numpy as np
 
+try:
+    from . import gibbs_kernel, parallel
+except ImportError:
+    import gibbs_kernel
+    import parallel
 
-def nested_sampling(n, a, N=2**18, verbose=True):
+
+def nested_sampling(n, a, N=2**18, verbose=True, seed=None, n_workers=None,
+                    return_samples=False, min_sweep_fraction=1.0):
     """
     Estimate P(mean(X_1,...,X_n) >= a) where X_i ~ N(0,1).
     
@@ -19,6 +26,21 @@ def nested_sampling(n, a, N=2**18, verbose=True):
         Number of samples per level (default: 2^18)
     verbose : bool
         Print iteration details
+    seed : int, optional
+        Seed for the SFC64 random generator (default: fresh entropy)
+    n_workers : int, optional
+        If greater than 1, split the particles into shared-memory shards
+        and run resampling and the NumPy Gibbs sweep in this many worker
+        processes (default: single process)
+    return_samples : bool
+        Include the final particles as 'final_samples' (default: False)
+    min_sweep_fraction : float
+        Fraction of coordinates every Gibbs pass updates before it may stop
+        early once the acceptance rate saturates (default: 1.0, always a
+        full sweep). Smaller values make each level cheaper but leave the
+        resampled particles less decorrelated, which can bias the estimate.
+        Only the NumPy sweep stops early; the compiled kernels always run a
+        full sweep. See ``gibbs_kernel.gibbs_pass``.
     
     Returns
     -------
@@ -28,14 +50,14 @@ def nested_sampling(n, a, N=2**18, verbose=True):
             Estimated probability (1/2)^K
         - K : int
             Number of iterations
-        - thresholds : list
+        - thresholds : ndarray
             Median threshold at each iteration
-        - vars_median : list
+        - vars_median : ndarray
             Variance of median at each iteration
-        - accept_rates : list
+        - accept_rates : ndarray
             Gibbs acceptance rate at each iteration
         - final_samples : ndarray
-            Final sample array (N x n)
+            Final sample array (N x n), only if return_samples is set
     """
     
     target = n * a  # Target sum
@@ -45,8 +67,26 @@ def nested_sampling(n, a, N=2**18, verbose=True):
     vars_median = []
     accept_rates = []
     
-    # Initialize
-    X = np.random.randn(N, n)
+    # Initialize. Particles are stored coordinate-major (n x N) so that
+    # each Gibbs coordinate X[j] is a contiguous row, and in float32 to
+    # halve memory traffic; particle sums are accumulated in float64.
+    rng = np.random.Generator(np.random.SFC64(seed))
+    if n_workers is not None and n_workers > 1:
+        shards = parallel.ShardedEnsemble(n, N, n_workers, rng)
+    else:
+        shards = None
+        X = rng.standard_normal((n, N), dtype=np.float32)
+        X_next = np.empty_like(X)
+        
+        # Scratch buffers for the NumPy Gibbs sweep, reused across levels:
+        # a per-level pool of proposals, new sums and the accept mask.
+        # The compiled kernels need none of them.
+        if gibbs_kernel.gibbs_sweep is None:
+            scratch = (np.empty((n, N), dtype=np.float32),
+                       np.empty(N),
+                       np.empty(N, dtype=bool))
+        else:
+            scratch = None
     
     if verbose:
         print("="*70)
@@ -56,63 +96,78 @@ def nested_sampling(n, a, N=2**18, verbose=True):
     
     iteration = 0
     
-    while True:
-        # Compute sums
-        sums = X.sum(axis=1)
-        
-        # Median threshold
-        u_next = np.median(sums)
-        thresholds.append(u_next)
-        
-        # Variance of median: Var(median) ≈ 1/(4*N*f(u)^2)
-        # Estimate f(u) using IQR: f(u) ≈ (N/2)/(Q75 - Q50)
-        q75, q50, q25 = np.percentile(sums, [75, 50, 25])
-        if q75 > q50:
-            f_u = (N / 2) / (q75 - q50)
-            var_median = 1.0 / (4 * N * f_u**2)
-        else:
-            var_median = np.inf
-        vars_median.append(var_median)
-        
-        if verbose:
-            print(f"\nIteration {iteration}:")
-            print(f"  u_{iteration+1} = {u_next:.4f}")
-            print(f"  Var(median) = {var_median:.4e}")
-        
-        # Check stopping condition
-        if u_next >= target:
+    try:
+        while True:
+            # Compute sums
+            if shards is None:
+                sums = X.sum(axis=0, dtype=np.float64)
+            else:
+                sums = shards.sums()
+            
+            # Median threshold, upper quartile and survivors from a single
+            # partial sort: everything from position N//2 up is >= u_next
+            order = np.argpartition(sums, [N // 2, 3 * N // 4 - 1])
+            u_next = sums[order[N // 2]]
+            q75 = sums[order[3 * N // 4 - 1]]
+            thresholds.append(u_next)
+            
+            # Variance of median: Var(median) ≈ 1/(4*N*f(u)^2)
+            # Estimate f(u) using IQR: f(u) ≈ (N/2)/(Q75 - Q50)
+            if q75 > u_next:
+                f_u = (N / 2) / (q75 - u_next)
+                var_median = 1.0 / (4 * N * f_u**2)
+            else:
+                var_median = np.inf
+            vars_median.append(var_median)
+            
             if verbose:
-                print(f"\nReached target! {u_next:.4f} >= {target:.2f}")
-            break
-        
-        # Selection: keep survivors
-        survivors = X[sums >= u_next]
-        n_survivors = len(survivors)
-        
-        if verbose:
-            print(f"  Survivors: {n_survivors}/{N}")
-        
-        # Resampling: restore population size
-        indices = np.random.choice(n_survivors, size=N, replace=True)
-        X = survivors[indices].copy()
-        
-        # Gibbs pass: one full sweep
-        total_accepts = 0
-        for j in range(n):
-            current_sums = X.sum(axis=1)
-            proposals = np.random.randn(N)
-            new_sums = current_sums - X[:, j] + proposals
-            accept = new_sums >= u_next
-            X[accept, j] = proposals[accept]
-            total_accepts += accept.sum()
-        
-        accept_rate = total_accepts / (N * n)
-        accept_rates.append(accept_rate)
-        
-        if verbose:
-            print(f"  Accept rate: {accept_rate:.4f}")
+                print(f"\nIteration {iteration}:")
+                print(f"  u_{iteration+1} = {u_next:.4f}")
+                print(f"  Var(median) = {var_median:.4e}")
+            
+            # Check stopping condition
+            if u_next >= target:
+                if verbose:
+                    print(f"\nReached target! {u_next:.4f} >= {target:.2f}")
+                break
+            
+            # Selection: indices of the top half
+            surv_idx = order[N // 2:]
+            n_survivors = surv_idx.size
+            
+            if verbose:
+                print(f"  Survivors: {n_survivors}/{N}")
+            
+            pick = surv_idx[rng.integers(0, n_survivors, size=N)]
+            
+            if shards is not None:
+                # Resampling and Gibbs pass, one shard per worker
+                total_accepts, n_moves = shards.advance(
+                    pick, u_next, rng, min_sweep_fraction)
+            else:
+                # Resampling: gather survivors into the spare buffer, then swap.
+                # mode='clip' keeps np.take from buffering the output.
+                np.take(X, pick, axis=1, out=X_next, mode='clip')
+                X, X_next = X_next, X
+                
+                # Gibbs pass (compiled kernel when one is available)
+                total_accepts, n_swept = gibbs_kernel.gibbs_pass(
+                    X, u_next, rng, scratch, min_sweep_fraction)
+                n_moves = N * n_swept
+            
+            accept_rate = total_accepts / n_moves
+            accept_rates.append(accept_rate)
+            
+            if verbose:
+                print(f"  Accept rate: {accept_rate:.4f}")
+            
+            iteration += 1
         
-        iteration += 1
+        if shards is not None and return_samples:
+            X = shards.samples()
+    finally:
+        if shards is not None:
+            shards.close()
     
     # Final result
     K = iteration
@@ -126,11 +181,14 @@ def nested_sampling(n, a, N=2**18, verbose=True):
         print(f"P = (1/2)^{K} = {prob:.6e}")
         print("="*70)
     
-    return {
+    results = {
         'probability': prob,
         'K': K,
-        'thresholds': thresholds,
-        'vars_median': vars_median,
-        'accept_rates': accept_rates,
-        'final_samples': X,
+        'thresholds': np.asarray(thresholds, dtype=np.float64),
+        'vars_median': np.asarray(vars_median, dtype=np.float64),
+        'accept_rates': np.asarray(accept_rates, dtype=np.float64),
     }
+    if return_samples:
+        results['final_samples'] = X.T
+    
+    return results
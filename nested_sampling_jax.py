@@ -0,0 +1,160 @@
+"""
+JAX implementation of the nested sampling algorithm for GPU execution.
+
+Requires jax. Each level runs as two jitted calls; the loop over levels
+stays in Python since K is small.
+"""
+
+import jax
+import jax.numpy as jnp
+import numpy as np
+
+
+@jax.jit
+def _split(X):
+    """Sort particle sums and read off the median threshold and Q75."""
+    N = X.shape[1]
+    sums = X.sum(axis=0)
+    order = jnp.argsort(sums)
+    return order, sums[order[N // 2]], sums[order[3 * N // 4 - 1]]
+
+
+@jax.jit
+def _advance(X, order, u, key):
+    """Resample the top half of the particles and run one Gibbs sweep."""
+    n, N = X.shape
+    key_pick, key_sweep = jax.random.split(key)
+
+    # Selection and resampling: the top half by sum survive
+    survivors = order[N // 2:]
+    pick = survivors[jax.random.randint(key_pick, (N,), 0, survivors.size)]
+    X = jnp.take(X, pick, axis=1)
+
+    # Gibbs pass: scan over coordinates carrying the particle sums
+    def coordinate(sums, xs):
+        x_j, k = xs
+        proposals = jax.random.normal(k, x_j.shape, x_j.dtype)
+        new_sums = sums - x_j + proposals
+        accept = new_sums >= u
+        x_j = jnp.where(accept, proposals, x_j)
+        return jnp.where(accept, new_sums, sums), (x_j, accept.sum())
+
+    keys = jax.random.split(key_sweep, n)
+    _, (X, accepts) = jax.lax.scan(coordinate, X.sum(axis=0), (X, keys))
+    return X, accepts.sum() / (N * n)
+
+
+def nested_sampling_jax(n, a, N=2**18, verbose=True, seed=None,
+                        return_samples=False):
+    """
+    Estimate P(mean(X_1,...,X_n) >= a) where X_i ~ N(0,1), using JAX.
+
+    Same algorithm and output as ``nested_sampling.nested_sampling``;
+    particles are held on the default JAX device in float32.
+
+    Parameters
+    ----------
+    n : int
+        Dimension
+    a : float
+        Target threshold for sample mean
+    N : int
+        Number of samples per level (default: 2^18)
+    verbose : bool
+        Print iteration details
+    seed : int, optional
+        Seed for the JAX PRNG key (default: fresh entropy)
+    return_samples : bool
+        Include the final particles as 'final_samples' (default: False)
+
+    Returns
+    -------
+    results : dict
+        Same keys as ``nested_sampling.nested_sampling``
+    """
+
+    target = n * a  # Target sum
+
+    # Storage
+    thresholds = []
+    vars_median = []
+    accept_rates = []
+
+    # Initialize, coordinate-major (n x N)
+    if seed is None:
+        seed = int(np.random.default_rng().integers(2**31))
+    key, key_init = jax.random.split(jax.random.PRNGKey(seed))
+    X = jax.random.normal(key_init, (n, N))
+
+    if verbose:
+        print("="*70)
+        print(f"Nested Sampling (JAX): n={n}, a={a}, N={N}")
+        print(f"Target sum: {target:.2f}")
+        print("="*70)
+
+    iteration = 0
+
+    while True:
+        # Median threshold and upper quartile
+        order, u, q75 = _split(X)
+        u_next = float(u)
+        q75 = float(q75)
+        thresholds.append(u_next)
+
+        # Variance of median: Var(median) ≈ 1/(4*N*f(u)^2)
+        # Estimate f(u) using IQR: f(u) ≈ (N/2)/(Q75 - Q50)
+        if q75 > u_next:
+            f_u = (N / 2) / (q75 - u_next)
+            var_median = 1.0 / (4 * N * f_u**2)
+        else:
+            var_median = np.inf
+        vars_median.append(var_median)
+
+        if verbose:
+            print(f"\nIteration {iteration}:")
+            print(f"  u_{iteration+1} = {u_next:.4f}")
+            print(f"  Var(median) = {var_median:.4e}")
+
+        # Check stopping condition
+        if u_next >= target:
+            if verbose:
+                print(f"\nReached target! {u_next:.4f} >= {target:.2f}")
+            break
+
+        if verbose:
+            print(f"  Survivors: {N - N // 2}/{N}")
+
+        # Resampling and Gibbs pass
+        key, key_level = jax.random.split(key)
+        X, accept_rate = _advance(X, order, u, key_level)
+        accept_rate = float(accept_rate)
+        accept_rates.append(accept_rate)
+
+        if verbose:
+            print(f"  Accept rate: {accept_rate:.4f}")
+
+        iteration += 1
+
+    # Final result
+    K = iteration
+    prob = 0.5 ** K
+
+    if verbose:
+        print("\n" + "="*70)
+        print("FINAL RESULTS")
+        print("="*70)
+        print(f"K = {K}")
+        print(f"P = (1/2)^{K} = {prob:.6e}")
+        print("="*70)
+
+    results = {
+        'probability': prob,
+        'K': K,
+        'thresholds': np.asarray(thresholds, dtype=np.float64),
+        'vars_median': np.asarray(vars_median, dtype=np.float64),
+        'accept_rates': np.asarray(accept_rates, dtype=np.float64),
+    }
+    if return_samples:
+        results['final_samples'] = np.asarray(X.T)
+
+    return results
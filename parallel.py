@@ -0,0 +1,172 @@
+"""
+Shared-memory particle shards for multi-process nested sampling.
+"""
+
+from multiprocessing import Pool, shared_memory
+
+import numpy as np
+
+try:
+    from . import gibbs_kernel
+except ImportError:
+    import gibbs_kernel
+
+
+# Worker-side views onto the shared blocks, set up by _init_worker
+_blocks = {}
+_scratch = {}
+
+
+def _init_worker(specs):
+    """Attach the shared blocks in a worker process."""
+    for key, (name, shape, dtype) in specs.items():
+        shm = shared_memory.SharedMemory(name=name)
+        _blocks[key] = (shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf))
+
+
+def _view(key):
+    return _blocks[key][1]
+
+
+def _scratch_buffers(n, size):
+    """Gibbs scratch buffers for a shard of the given size, reused across levels."""
+    if size not in _scratch:
+        _scratch[size] = (np.empty((n, size), dtype=np.float32),
+                          np.empty(size),
+                          np.empty(size, dtype=bool))
+    return _scratch[size]
+
+
+def _init_shard(task):
+    """Draw the initial particles of one shard and write their sums."""
+    lo, hi, seed = task
+    rng = np.random.Generator(np.random.SFC64(seed))
+    X = _view('X0')[:, lo:hi]
+    for row in X:
+        rng.standard_normal(dtype=np.float32, out=row)
+    np.sum(X, axis=0, dtype=np.float64, out=_view('sums')[lo:hi])
+
+
+def _advance_shard(task):
+    """Resample one shard from the full population and run a Gibbs pass on it."""
+    lo, hi, src, u, seed, min_sweep_fraction = task
+    rng = np.random.Generator(np.random.SFC64(seed))
+    X_src = _view(f'X{src}')
+    X = _view(f'X{1 - src}')[:, lo:hi]
+    pick = _view('pick')[lo:hi]
+
+    # Gather row by row so each output slice is contiguous
+    for j in range(X.shape[0]):
+        np.take(X_src[j], pick, out=X[j], mode='clip')
+
+    total_accepts, n_swept = gibbs_kernel.gibbs_pass(
+        X, u, rng, _scratch_buffers(X.shape[0], hi - lo), min_sweep_fraction, compiled=False)
+    np.sum(X, axis=0, dtype=np.float64, out=_view('sums')[lo:hi])
+    return total_accepts, (hi - lo) * n_swept
+
+
+class ShardedEnsemble:
+    """
+    Particle population split into contiguous column shards across a
+    process pool.
+
+    The (n x N) float32 particles, a spare resampling buffer, the particle
+    sums and the resampling indices live in shared memory. Each level the
+    head writes the indices, and each worker gathers its shard from the
+    full population, runs a NumPy Gibbs pass on it with its own seeded
+    generator and writes its sums back. Only the threshold, seeds and
+    accept counts are sent through the pool.
+
+    Parameters
+    ----------
+    n : int
+        Dimension
+    N : int
+        Number of particles
+    n_workers : int
+        Number of worker processes (one shard each)
+    rng : numpy.random.Generator
+        Source of the per-shard seeds
+    """
+
+    def __init__(self, n, N, n_workers, rng):
+        specs = {
+            'X0': ((n, N), np.float32),
+            'X1': ((n, N), np.float32),
+            'sums': ((N,), np.float64),
+            'pick': ((N,), np.intp),
+        }
+        self._shm = {}
+        self._views = {}
+        self._pool = None
+        try:
+            for key, (shape, dtype) in specs.items():
+                size = int(np.prod(shape)) * np.dtype(dtype).itemsize
+                shm = shared_memory.SharedMemory(create=True, size=size)
+                self._shm[key] = shm
+                self._views[key] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+            worker_specs = {key: (self._shm[key].name, shape, dtype)
+                            for key, (shape, dtype) in specs.items()}
+            self._pool = Pool(n_workers, initializer=_init_worker,
+                              initargs=(worker_specs,))
+
+            bounds = np.linspace(0, N, n_workers + 1).astype(int)
+            self._shards = list(zip(bounds[:-1], bounds[1:]))
+            self._src = 0
+
+            seeds = rng.integers(2**63, size=n_workers)
+            self._pool.map(_init_shard, [(lo, hi, seed) for (lo, hi), seed
+                                         in zip(self._shards, seeds)])
+        except BaseException:
+            self.close()
+            raise
+
+    def sums(self):
+        """Copy of the current particle sums (length N)."""
+        return self._views['sums'].copy()
+
+    def samples(self):
+        """Copy of the current particles (n x N)."""
+        return self._views[f'X{self._src}'].copy()
+
+    def advance(self, pick, u, rng, min_sweep_fraction=1.0):
+        """
+        Resample the population to ``pick`` and run one Gibbs pass.
+
+        Parameters
+        ----------
+        pick : ndarray
+            Indices of the particles that make up the next population
+        u : float
+            Current level threshold on the particle sum
+        rng : numpy.random.Generator
+            Source of the per-shard seeds
+        min_sweep_fraction : float
+            Passed to ``gibbs_kernel.gibbs_pass`` in each shard
+
+        Returns
+        -------
+        total_accepts : int
+            Number of accepted coordinate moves across all shards
+        n_moves : int
+            Number of proposed coordinate moves across all shards
+        """
+        self._views['pick'][:] = pick
+        seeds = rng.integers(2**63, size=len(self._shards))
+        tasks = [(lo, hi, self._src, u, seed, min_sweep_fraction)
+                 for (lo, hi), seed in zip(self._shards, seeds)]
+        counts = self._pool.map(_advance_shard, tasks)
+        self._src = 1 - self._src
+        return sum(c[0] for c in counts), sum(c[1] for c in counts)
+
+    def close(self):
+        """Shut down the pool and release the shared memory."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        self._views.clear()
+        for shm in self._shm.values():
+            shm.close()
+            shm.unlink()
+        self._shm.clear()
@@ -3,7 +3,6 @@ Plotting functions for diagnostic visualizations.
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
 
 
 def plot_diagnostics(results, n, a, filename='diagnostics.png'):
@@ -22,6 +21,9 @@ def plot_diagnostics(results, n, a, filename='diagnostics.png'):
         Output filename (default: 'diagnostics.png')
     """
     
+    # Imported here so compute-only users of the package never load matplotlib
+    import matplotlib.pyplot as plt
+    
     thresholds = results['thresholds']
     vars_median = results['vars_median']
     accept_rates = results['accept_rates']
@@ -42,7 +44,7 @@ def plot_diagnostics(results, n, a, filename='diagnostics.png'):
     
     # Panel 2: Threshold spacing
     ax = axes[0, 1]
-    increments = np.diff([0] + thresholds)
+    increments = np.diff(thresholds, prepend=0)
     ax.plot(levels, increments, 's-', markersize=3, color='green')
     expected = 0.67 * np.sqrt(n)
     ax.axhline(expected, color='r', linestyle='--', label=f'Expected≈{expected:.2f}')
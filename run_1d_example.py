@@ -18,13 +18,17 @@ sys.path.insert(0, src_path)
 import utils
 
 import numpy as np
-import matplotlib.pyplot as plt
+from scipy import stats
 
 
-def nested_sampling_1d(a, N=2**12, verbose=True):
+def nested_sampling_1d(a, N=2**12, verbose=True, seed=None):
     """
     1D nested sampling for P(X >= a) where X ~ N(0,1).
     
+    In 1D the law of X conditioned on X >= u is a truncated normal, so
+    each level draws the next population from it directly instead of
+    resampling survivors and running a Gibbs pass.
+    
     Parameters
     ----------
     a : float
@@ -33,18 +37,22 @@ def nested_sampling_1d(a, N=2**12, verbose=True):
         Number of samples per level
     verbose : bool
         Print details
+    seed : int, optional
+        Seed for the SFC64 random generator
     
     Returns
     -------
     results : dict
+        Dictionary containing 'probability', 'K' and 'thresholds'. There
+        is no acceptance step, so no acceptance rates are reported.
     """
     
     # Storage
     thresholds = []
-    accept_rates = []
     
     # Initialize
-    X = np.random.randn(N, 1)
+    rng = np.random.Generator(np.random.SFC64(seed))
+    X = rng.standard_normal((N, 1))
     
     if verbose:
         print("="*70)
@@ -54,8 +62,8 @@ def nested_sampling_1d(a, N=2**12, verbose=True):
     iteration = 0
     
     while True:
-        # Median threshold
-        u_next = np.median(X[:, 0])
+        # Median threshold (upper-middle order statistic, no interpolation)
+        u_next = np.partition(X[:, 0], N // 2)[N // 2]
         thresholds.append(u_next)
         
         if verbose:
@@ -68,27 +76,8 @@ def nested_sampling_1d(a, N=2**12, verbose=True):
                 print(f"\nReached target! {u_next:.4f} >= {a:.2f}")
             break
         
-        # Selection
-        survivors = X[X[:, 0] >= u_next]
-        n_survivors = len(survivors)
-        
-        if verbose:
-            print(f"  Survivors: {n_survivors}/{N}")
-        
-        # Resampling
-        indices = np.random.choice(n_survivors, size=N, replace=True)
-        X = survivors[indices].copy()
-        
-        # Gibbs pass
-        proposals = np.random.randn(N)
-        accept = proposals >= u_next
-        X[accept, 0] = proposals[accept]
-        
-        accept_rate = accept.sum() / N
-        accept_rates.append(accept_rate)
-        
-        if verbose:
-            print(f"  Accept rate: {accept_rate:.4f}")
+        # Exact conditional update: X | X >= u_next
+        X[:, 0] = stats.truncnorm.rvs(u_next, np.inf, size=N, random_state=rng)
         
         iteration += 1
     
@@ -106,7 +95,6 @@ def nested_sampling_1d(a, N=2**12, verbose=True):
         'probability': prob,
         'K': K,
         'thresholds': thresholds,
-        'accept_rates': accept_rates,
     }
 
 
@@ -140,6 +128,8 @@ def main():
     print()
     
     # Plot
+    import matplotlib.pyplot as plt
+    
     fig, ax = plt.subplots(1, 2, figsize=(12, 4))
     
     ax[0].plot(results['thresholds'], 'o-')
@@ -150,13 +140,10 @@ def main():
     ax[0].legend()
     ax[0].grid(True, alpha=0.3)
     
-    ax[1].plot(results['accept_rates'], 's-')
-    ax[1].axhline(0.5, color='r', linestyle='--', label='Expected=0.5')
+    ax[1].plot(np.diff(results['thresholds'], prepend=0), 's-', color='green')
     ax[1].set_xlabel('Iteration')
-    ax[1].set_ylabel('Acceptance Rate')
-    ax[1].set_title('Accept Rate')
-    ax[1].set_ylim([0, 1])
-    ax[1].legend()
+    ax[1].set_ylabel('Increment')
+    ax[1].set_title('Threshold Spacing')
     ax[1].grid(True, alpha=0.3)
     
     plt.tight_layout()
@@ -18,6 +18,7 @@ def validate_median_clt():
     
     num_reps = 10000
     sample_size = 10000
+    chunk = 500  # Replications generated per batch
     
     print("="*70)
     print("MEDIAN CLT VALIDATION")
@@ -26,12 +27,16 @@ def validate_median_clt():
     print(f"Sample size: {sample_size:,}")
     print()
     
-    # Generate data and compute medians
-    print("Generating data...")
-    data = np.random.randn(num_reps, sample_size)
-    
-    print("Computing medians...")
-    medians = np.median(data, axis=1)
+    # Generate data and compute medians batch by batch, reusing one
+    # (chunk x sample_size) buffer instead of the full data matrix
+    print("Generating data and computing medians...")
+    rng = np.random.Generator(np.random.SFC64())
+    medians = np.empty(num_reps)
+    buf = np.empty((chunk, sample_size))
+    for i in range(0, num_reps, chunk):
+        rows = buf[:min(chunk, num_reps - i)]
+        rng.standard_normal(out=rows)
+        medians[i:i + len(rows)] = np.median(rows, axis=1, overwrite_input=True)
     
     # Theoretical values for N(0,1)
     true_median = 0.0
@@ -0,0 +1,31 @@
+"""
+Build the optional OpenMP Gibbs sweep extension.
+
+Usage:
+    python setup.py build_ext --inplace
+"""
+
+import os
+
+import numpy as np
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+# numpy ships its C distributions as a static library next to numpy.random
+numpy_random_lib = os.path.join(os.path.dirname(np.__file__), 'random', 'lib')
+
+gibbs_core = Extension(
+    'gibbs_core',
+    sources=['gibbs_core.pyx'],
+    include_dirs=[np.get_include()],
+    library_dirs=[numpy_random_lib],
+    libraries=['npyrandom', 'm'],
+    define_macros=[('NPY_NO_DEPRECATED_API', 'NPY_1_7_API_VERSION')],
+    extra_compile_args=['-fopenmp', '-O3', '-march=native'],
+    extra_link_args=['-fopenmp'],
+)
+
+setup(
+    name='gibbs_core',
+    ext_modules=cythonize([gibbs_core]),
+)
@@ -2,47 +2,72 @@
 Utility functions for theoretical benchmarks.
 """
 
+import math
+
 import numpy as np
 from scipy.stats import norm
 
 
-def gaussian_tail_exact(a, n):
+_LOG_SQRT_2PI = 0.5 * math.log(2.0 * math.pi)
+
+
+def _scaled_threshold(a, n):
+    """z = a*sqrt(n), using math for scalar inputs to skip NumPy dispatch."""
+    if np.isscalar(a) and np.isscalar(n):
+        return a * math.sqrt(n)
+    return np.asarray(a) * np.sqrt(n)
+
+
+def gaussian_tail_exact(a, n, log=False):
     """
     Exact probability P(mean(X_1,...,X_n) >= a) where X_i ~ N(0,1).
     
+    Broadcasts over array-valued ``a`` and ``n``.
+    
     Parameters
     ----------
-    a : float
+    a : float or array_like
         Threshold for sample mean
-    n : int
+    n : int or array_like
         Number of samples
+    log : bool
+        Return log(P) instead of P, for regimes where P underflows
     
     Returns
     -------
-    prob : float
-        Exact probability using CDF
+    prob : float or ndarray
+        Exact probability using CDF (or its log)
     """
-    z = a * np.sqrt(n)
-    return norm.sf(z)
+    z = _scaled_threshold(a, n)
+    return norm.logsf(z) if log else norm.sf(z)
 
 
-def mills_approximation(a, n):
+def mills_approximation(a, n, log=False):
     """
     Mills ratio approximation for Gaussian tail probability.
     
     For X ~ N(0,1), approximates P(X > z) ≈ (1/z√(2π)) * exp(-z²/2)
     
+    Evaluated in the log domain and broadcast over array-valued ``a``
+    and ``n``.
+    
     Parameters
     ----------
-    a : float
+    a : float or array_like
         Threshold
-    n : int
+    n : int or array_like
         Dimension
+    log : bool
+        Return log(P) instead of P, for regimes where P underflows
     
     Returns
     -------
-    prob : float
-        Approximate probability
+    prob : float or ndarray
+        Approximate probability (or its log)
     """
-    z = a * np.sqrt(n)
-    return (1.0 / (z * np.sqrt(2 * np.pi))) * np.exp(-z**2 / 2)
+    z = _scaled_threshold(a, n)
+    if isinstance(z, float) and z > 0:
+        log_prob = -0.5 * z * z - math.log(z) - _LOG_SQRT_2PI
+        return log_prob if log else math.exp(log_prob)
+    log_prob = -0.5 * z * z - np.log(z) - _LOG_SQRT_2PI
+    return log_prob if log else np.exp(log_prob)